@@ -7,31 +7,66 @@ via Cloud Storage staging with schema autodetection.
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import math
+import os
+import random
+import secrets
+import threading
 import time
-import uuid
-from datetime import UTC, datetime
-from functools import wraps
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from datetime import UTC, date, datetime
+from datetime import time as dt_time
+from decimal import Decimal
+from functools import cache, wraps
+from itertools import chain, count, islice
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
 from zoneinfo import ZoneInfo
 
+import orjson
 from pydantic import BaseModel
 
 # Only import Callable if type checking is active
 if TYPE_CHECKING:
-    from collections.abc import Callable
-
-from google.api_core.exceptions import GoogleAPIError, ServerError, ServiceUnavailable
-from google.cloud import bigquery
+    from collections.abc import Callable, Sequence
+
+    import pyarrow as pa
+    from google.protobuf.message import Message
+
+from google.api_core.exceptions import (
+    Conflict,
+    GoogleAPIError,
+    ServerError,
+    ServiceUnavailable,
+)
+from google.cloud import bigquery, bigquery_storage
+from google.cloud.bigquery_storage_v1 import types as bqstorage_types
+from google.cloud.bigquery_storage_v1 import writer as bqstorage_writer
 from google.cloud.exceptions import NotFound
+from google.protobuf import (
+    descriptor_pb2,
+    descriptor_pool,
+    json_format,
+    message_factory,
+)
 
 from vnp.logger import get_logger
 from vnp.storage import StorageController
 
 logger = get_logger(__name__)
 
+# Banner around log messages
+_SEP = "=" * 10
+
 # Type variable for generic return
 T = TypeVar("T")
 
+# Process-local counter keeping staging file prefixes unique within a second,
+# combined with a random token for processes on other hosts
+_batch_counter = count()
+
 
 # Structure of bigquery_payload using dataclass
 class BigqueryPayload(BaseModel):
@@ -60,11 +95,32 @@ DEFAULT_CONFIG: dict[str, int | float | str] = {
     "retry_multiplier": 2,
     "max_retry_delay": 60,  # seconds
     "chunk_size": 10000,  # records per chunk
+    "max_parallel_chunks": 8,  # chunks uploaded and loaded concurrently
+    "storage_write_max_records": 1000,  # appends up to this size skip GCS, 0 disables
     "temp_table_prefix": "temp_",
     "temp_table_suffix_format": "%Y%m%d%H%M%S",
 }
 
 
+@cache
+def _bigquery_client(project_id: str) -> bigquery.Client:
+    """
+    Return the BigQuery client for a project, shared by all controllers.
+
+    Credentials are discovered once per project and cached for the lifetime of
+    the process, so controllers created for the same project reuse one client
+    and its connections.
+
+    Args:
+        project_id: GCP project ID
+
+    Returns:
+        bigquery.Client: BigQuery client instance
+
+    """
+    return bigquery.Client(project=project_id)
+
+
 def retry_on_transient_error(
     max_retries: int = 3,
     initial_delay: float = 1,
@@ -72,12 +128,16 @@ def retry_on_transient_error(
     max_delay: float = 60,
 ) -> Callable[..., Any]:
     """
-    Retries a function on transient errors with exponential backoff.
+    Retries a function on transient errors with exponential backoff and jitter.
+
+    Delays use decorrelated jitter: each one is drawn at random between
+    initial_delay and backoff_factor times the previous delay, so callers that
+    fail together (e.g. parallel chunk uploads) do not retry in lockstep.
 
     Args:
         max_retries: Maximum number of retry attempts
         initial_delay: Initial delay between retries in seconds
-        backoff_factor: Multiplier for the delay after each retry
+        backoff_factor: Upper bound multiplier for the delay after each retry
         max_delay: Maximum delay between retries in seconds
 
     Returns:
@@ -88,7 +148,7 @@ def retry_on_transient_error(
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            delay = initial_delay
+            sleep_time = initial_delay
             last_exception = None
 
             for attempt in range(max_retries + 1):
@@ -102,24 +162,31 @@ def retry_on_transient_error(
                 ) as e:
                     last_exception = e
                     if attempt < max_retries:
-                        sleep_time = min(delay, max_delay)
-                        warning_msg = (
-                            f"{'=' * 10} Transient error occurred: {e!s}. "
-                            f"Retrying in {sleep_time:.1f} seconds. "
-                            f"(Attempt {attempt + 1}/{max_retries}) {'=' * 10}"
+                        sleep_time = min(
+                            max_delay,
+                            random.uniform(initial_delay, sleep_time * backoff_factor),
+                        )
+                        logger.warning(
+                            "%s Transient error occurred: %s. "
+                            "Retrying in %.1f seconds. (Attempt %d/%d) %s",
+                            _SEP,
+                            e,
+                            sleep_time,
+                            attempt + 1,
+                            max_retries,
+                            _SEP,
                         )
-                        logger.warning(warning_msg)
                         time.sleep(sleep_time)
-                        delay *= backoff_factor
                     else:
-                        error_msg = f"{'=' * 10} Operation failed after {max_retries} retries {'=' * 10}"
-                        logger.exception(error_msg)
+                        logger.exception(
+                            "%s Operation failed after %d retries %s",
+                            _SEP,
+                            max_retries,
+                            _SEP,
+                        )
                         raise
-                except Exception as e:
-                    error_msg = (
-                        f"{'=' * 10} Non-transient error occurred: {e!s} {'=' * 10}"
-                    )
-                    logger.exception(error_msg)
+                except Exception:
+                    logger.exception("%s Non-transient error occurred %s", _SEP, _SEP)
                     raise
 
             # Handle unexpected loop exit
@@ -135,6 +202,196 @@ def retry_on_transient_error(
     return decorator
 
 
+# The Storage Write API rejects append requests larger than 10 MB
+APPEND_ROWS_MAX_BYTES = 9 * 1024 * 1024
+
+# Protobuf types used to send BigQuery columns through the Storage Write API.
+# Other scalar types (NUMERIC, DATETIME, TIME, JSON, GEOGRAPHY, ...) are sent as strings.
+_FieldProto = descriptor_pb2.FieldDescriptorProto
+PROTO_FIELD_TYPES: dict[str, int] = {
+    "STRING": _FieldProto.TYPE_STRING,
+    "BYTES": _FieldProto.TYPE_BYTES,
+    "INTEGER": _FieldProto.TYPE_INT64,
+    "INT64": _FieldProto.TYPE_INT64,
+    "FLOAT": _FieldProto.TYPE_DOUBLE,
+    "FLOAT64": _FieldProto.TYPE_DOUBLE,
+    "BOOLEAN": _FieldProto.TYPE_BOOL,
+    "BOOL": _FieldProto.TYPE_BOOL,
+    "TIMESTAMP": _FieldProto.TYPE_INT64,  # microseconds since epoch
+    "DATE": _FieldProto.TYPE_INT32,  # days since epoch
+}
+RECORD_FIELD_TYPES = ("RECORD", "STRUCT")
+
+
+def _add_proto_fields(
+    message: descriptor_pb2.DescriptorProto,
+    schema: Sequence[bigquery.SchemaField],
+    scope: str,
+) -> None:
+    """
+    Add one protobuf field per BigQuery column to a message descriptor.
+
+    Args:
+        message: Message descriptor to extend
+        schema: BigQuery columns of the message
+        scope: Fully qualified name of the message, used to reference nested types
+
+    Raises:
+        ValueError: If a column name is not a valid protobuf field name
+
+    """
+    for number, field in enumerate(schema, start=1):
+        if not field.name.isidentifier():
+            error_message = f"Column {field.name} cannot be used as a protobuf field"
+            raise ValueError(error_message)
+
+        proto_field = message.field.add(
+            name=field.name,
+            number=number,
+            label=_FieldProto.LABEL_REPEATED
+            if field.mode == "REPEATED"
+            else _FieldProto.LABEL_OPTIONAL,
+        )
+        if field.field_type in RECORD_FIELD_TYPES:
+            nested = message.nested_type.add(name=f"{field.name}__Record")
+            _add_proto_fields(nested, field.fields, f"{scope}.{nested.name}")
+            proto_field.type = _FieldProto.TYPE_MESSAGE
+            proto_field.type_name = f"{scope}.{nested.name}"
+        else:
+            proto_field.type = PROTO_FIELD_TYPES.get(
+                field.field_type, _FieldProto.TYPE_STRING
+            )
+
+
+def _build_row_message(
+    schema: Sequence[bigquery.SchemaField],
+) -> tuple[descriptor_pb2.DescriptorProto, type[Message]]:
+    """
+    Build a self-contained protobuf message type matching a table schema.
+
+    Args:
+        schema: BigQuery table schema
+
+    Returns:
+        tuple[descriptor_pb2.DescriptorProto, type[Message]]: Descriptor to send
+            to the Storage Write API and the message class to encode rows with
+
+    """
+    file_proto = descriptor_pb2.FileDescriptorProto(
+        name="vnp_row.proto", syntax="proto2"
+    )
+    row_proto = file_proto.message_type.add(name="Row")
+    _add_proto_fields(row_proto, schema, ".Row")
+
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file_proto)
+    row_class = message_factory.GetMessageClass(pool.FindMessageTypeByName("Row"))
+    return row_proto, row_class
+
+
+def _to_proto_json(
+    fields_by_name: dict[str, bigquery.SchemaField], row: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    Convert a record to the JSON form of its protobuf message.
+
+    Args:
+        fields_by_name: BigQuery columns of the record keyed by name
+        row: Record to convert
+
+    Returns:
+        dict[str, Any]: Record that json_format.ParseDict can encode
+
+    Raises:
+        ValueError: If the record has a field that is not in the schema, or a
+            repeated field whose value is not a list or tuple
+        TypeError: If the record is not a dict
+
+    """
+    if not isinstance(row, dict):
+        error_message = f"Expected a dict for a record, got {type(row).__name__}"
+        raise TypeError(error_message)
+
+    converted = {}
+    for name, value in row.items():
+        if value is None:
+            continue
+        field = fields_by_name.get(name)
+        if field is None:
+            error_message = f"No such field in table schema: {name}"
+            raise ValueError(error_message)
+        if field.mode != "REPEATED":
+            converted[name] = _to_proto_json_value(field, value)
+            continue
+        if not isinstance(value, (list, tuple)):
+            error_message = (
+                f"Expected a list for repeated field {name}, got {type(value).__name__}"
+            )
+            raise ValueError(error_message)
+        converted[name] = [_to_proto_json_value(field, item) for item in value]
+    return converted
+
+
+def _to_proto_json_value(field: bigquery.SchemaField, value: Any) -> Any:
+    """
+    Convert a single column value to the JSON form of its protobuf field.
+
+    Args:
+        field: BigQuery column of the value
+        value: Value to convert
+
+    Returns:
+        Any: Value that json_format.ParseDict can encode
+
+    Raises:
+        TypeError: If a TIMESTAMP value is not a number, string, datetime or date
+
+    """
+    field_type = field.field_type
+    if field_type in RECORD_FIELD_TYPES:
+        return _to_proto_json({f.name: f for f in field.fields}, value)
+
+    if field_type == "TIMESTAMP":
+        if isinstance(value, (int, float)):
+            return int(value * 1_000_000)  # seconds since epoch, as in JSON loads
+        if isinstance(value, str):
+            timestamp = datetime.fromisoformat(value)
+        elif isinstance(value, datetime):
+            timestamp = value
+        elif isinstance(value, date):
+            # Midnight UTC, as a load job reads a date in a TIMESTAMP column
+            timestamp = datetime(value.year, value.month, value.day)
+        else:
+            error_message = f"Cannot convert {type(value).__name__} to a TIMESTAMP"
+            raise TypeError(error_message)
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=UTC)
+        delta = timestamp - datetime(1970, 1, 1, tzinfo=UTC)
+        return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+    if field_type == "DATE":
+        day = date.fromisoformat(value) if isinstance(value, str) else value
+        if isinstance(day, datetime):
+            day = day.date()
+        return (day - date(1970, 1, 1)).days
+
+    if field_type == "BYTES" and isinstance(value, bytes):
+        return base64.b64encode(value).decode()
+
+    # Numbers and booleans are coerced by ParseDict itself
+    if field_type in PROTO_FIELD_TYPES and field_type != "STRING":
+        return value
+
+    # Everything else is sent as a string
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (date, dt_time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return orjson.dumps(value).decode()
+
+
 class BigQueryController:
     """
     BigQuery controller class with Cloud Storage staging support and schema autodetection.
@@ -144,9 +401,16 @@ class BigQueryController:
         project_id (str): GCP project ID
         table_id (str): BigQuery table ID
         bucket_name (str): GCS bucket name for data staging
-        client (bigquery.Client): BigQuery client instance
+        client (bigquery.Client): BigQuery client instance, shared by controllers of the same project
+        bqstorage_client (bigquery_storage.BigQueryReadClient): Storage Read API client, created on first use
+        bqwrite_client (bigquery_storage.BigQueryWriteClient): Storage Write API client, created on first use
         storage_controller (StorageController): Storage controller for GCS operations
         config (dict): Controller configuration options
+        chunk_size (int): Records per staged chunk
+        max_parallel_chunks (int): Chunks uploaded to GCS concurrently
+        storage_write_max_records (int): Largest append sent through the Storage Write API
+        temp_table_prefix (str): Prefix of temporary table names
+        temp_table_suffix_format (str): strftime format of temporary table name suffixes
 
     """
 
@@ -177,9 +441,29 @@ class BigQueryController:
             if config:
                 self.config.update(config)
 
+            # Typed copies of the options used on hot paths
+            self.chunk_size = int(self.config["chunk_size"])
+            self.max_parallel_chunks = int(self.config["max_parallel_chunks"])
+            self.storage_write_max_records = int(
+                self.config["storage_write_max_records"]
+            )
+            self.temp_table_prefix = str(self.config["temp_table_prefix"])
+            self.temp_table_suffix_format = str(self.config["temp_table_suffix_format"])
+
             # Initialize clients using automatically detected credentials
-            self.client = bigquery.Client(project=self.project_id)
+            self.client = _bigquery_client(self.project_id)
             self.table_ref = self.client.dataset(self.dataset_id).table(self.table_id)
+            self._bqstorage_client: bigquery_storage.BigQueryReadClient | None = None
+            self._bqwrite_client: bigquery_storage.BigQueryWriteClient | None = None
+
+            # Table metadata cached within an export, refreshed at the start of
+            # each export, when the controller changes the table itself and when
+            # the table turns out to be missing
+            self._table_cache: bigquery.Table | None = None
+            self._table_cache_lock = threading.Lock()
+
+            # Serializes table creation between concurrent exports
+            self._table_create_lock = threading.Lock()
 
             # Ensure bucket_name is not None before passing to StorageController
             if self.bucket_name is None:
@@ -193,16 +477,41 @@ class BigQueryController:
             )
 
             logger.info(
-                f"{'=' * 10} BigQueryController initialized for {self.dataset_id}.{self.table_id} {'=' * 10}"
+                "%s BigQueryController initialized for %s.%s %s",
+                _SEP,
+                self.dataset_id,
+                self.table_id,
+                _SEP,
             )
         except Exception:
             logger.exception(
-                f"{'=' * 10} Failed to initialize BigQueryController. {'=' * 10}"
+                "%s Failed to initialize BigQueryController. %s", _SEP, _SEP
             )
             raise
 
+    def _get_cached_table(self) -> bigquery.Table:
+        """
+        Return the table metadata, fetching it only if it is not cached yet.
+
+        Returns:
+            bigquery.Table: The target table
+
+        Raises:
+            NotFound: If the table does not exist
+
+        """
+        with self._table_cache_lock:
+            if self._table_cache is None:
+                self._table_cache = self.client.get_table(self.table_ref)
+            return self._table_cache
+
+    def _invalidate_table_cache(self) -> None:
+        """Drop the cached table metadata after the table has been changed."""
+        with self._table_cache_lock:
+            self._table_cache = None
+
     @retry_on_transient_error()
-    def _load_data_from_gcs(self, gcs_uri: str, write_disposition: str) -> None:
+    def _load_data_from_gcs(self, gcs_uri: str, write_disposition: str) -> int:
         """
         Load data from GCS without schema evolution.
 
@@ -210,13 +519,16 @@ class BigQueryController:
             gcs_uri: GCS URI of the data file
             write_disposition: BigQuery write disposition
 
+        Returns:
+            int: Number of rows loaded
+
         Raises:
             Exception: If loading fails
 
         """
         try:
             # Get current table schema
-            table = self.client.get_table(self.table_ref)
+            table = self._get_cached_table()
 
             # Load data with the current schema
             job_config = bigquery.LoadJobConfig(
@@ -229,163 +541,290 @@ class BigQueryController:
             )
             load_job.result()
 
+        except NotFound:
+            # The table was dropped since it was cached
+            self._invalidate_table_cache()
+            logger.exception("%s Failed to load data %s", _SEP, _SEP)
+            raise
         except Exception:
-            logger.exception(f"{'=' * 10} Failed to load data {'=' * 10}")
+            logger.exception("%s Failed to load data %s", _SEP, _SEP)
             raise
 
-    @retry_on_transient_error()
-    def _create_partitioned_table(self, temp_suffix: str | None = None) -> None:
+        else:
+            return load_job.output_rows or 0
+
+    def _temp_table_id(self) -> str:
         """
-        Create a time-partitioned table using the detected schema.
+        Generate the name of a temporary table next to the target table.
+
+        A random token keeps the names of concurrent calls apart.
+
+        Returns:
+            str: Temporary table ID
+
+        """
+        temp_suffix = datetime.now(ZoneInfo("Europe/Berlin")).strftime(
+            self.temp_table_suffix_format
+        )
+        return (
+            f"{self.table_id}_{self.temp_table_prefix}{temp_suffix}"
+            f"_{secrets.token_hex(4)}"
+        )
+
+    def _delete_staging_table(self, staging_table_ref: bigquery.TableReference) -> None:
+        """
+        Delete a staging table, logging instead of raising if that fails.
+
+        A failure only leaves the staging table behind, so it does not fail the
+        export that used it.
+
+        Args:
+            staging_table_ref: Reference of the staging table
+
+        """
+        try:
+            self.client.delete_table(staging_table_ref, not_found_ok=True)
+        except GoogleAPIError:
+            logger.warning(
+                "%s Failed to delete staging table %s %s",
+                _SEP,
+                staging_table_ref.table_id,
+                _SEP,
+                exc_info=True,
+            )
+
+    def _create_partitioned_table(self, staging_table_id: str) -> bool:
+        """
+        Create the time-partitioned target table from a staging table.
 
         Creates a partitioned table on import_timestamp field without partition expiration.
-        Partitioned filter is not required.
+        Partitioned filter is not required. The data is copied with a single CTAS
+        statement. The staging table is left in place for the caller to delete.
 
         Args:
-            temp_suffix: Optional suffix for the temporary table name
+            staging_table_id: ID of the staging table holding the data
+
+        Returns:
+            bool: True if the table was created, False if another writer created
+                it first and the data was not copied
 
         Raises:
             Exception: For other unexpected errors during the operation
 
         """
-        logger.debug(f"{'=' * 10} Creating partition on the table {'=' * 10}")
+        logger.debug("%s Creating partition on the table %s", _SEP, _SEP)
 
         try:
-            # Get current table schema
-            table = self.client.get_table(self.table_ref)
-            schema = list(table.schema)
+            # Get staging table schema
+            staging_table = self.client.get_table(
+                self.client.dataset(self.dataset_id).table(staging_table_id)
+            )
 
             # Handle import_timestamp field
             import_timestamp_field = next(
-                (field for field in schema if field.name == "import_timestamp"), None
+                (
+                    field
+                    for field in staging_table.schema
+                    if field.name == "import_timestamp"
+                ),
+                None,
             )
 
             if not import_timestamp_field:
-                schema.append(
-                    bigquery.SchemaField(
-                        name="import_timestamp", field_type="TIMESTAMP", mode="NULLABLE"
-                    )
-                )
+                projection = "*, CURRENT_TIMESTAMP() AS import_timestamp"
             elif import_timestamp_field.field_type != "TIMESTAMP":
-                schema = [field for field in schema if field.name != "import_timestamp"]
-                schema.append(
-                    bigquery.SchemaField(
-                        name="import_timestamp", field_type="TIMESTAMP", mode="NULLABLE"
-                    )
+                projection = (
+                    "* REPLACE (TIMESTAMP(import_timestamp) AS import_timestamp)"
                 )
+            else:
+                projection = "*"
 
-            # Generate temporary table name
-            temp_suffix_format_str = cast(
-                str, self.config["temp_table_suffix_format"]
-            )  # Type assertion
-            temp_suffix = temp_suffix or datetime.now(
-                ZoneInfo("Europe/Berlin")
-            ).strftime(
-                temp_suffix_format_str,
-            )
-            temp_table_prefix_str = cast(
-                str, self.config["temp_table_prefix"]
-            )  # Type assertion
-            temp_table_id = f"{self.table_id}_{temp_table_prefix_str}{temp_suffix}"
-            temp_table_ref = self.client.dataset(self.dataset_id).table(temp_table_id)
-
-            # Create new partitioned table with the temporary name
-            new_table = bigquery.Table(temp_table_ref, schema=schema)
-            new_table.time_partitioning = bigquery.TimePartitioning(
-                type_=bigquery.TimePartitioningType.DAY,
-                field="import_timestamp",
-                require_partition_filter=False,  # Partition filter not required
-                expiration_ms=None,  # No expiration
+            query = f"""
+            CREATE TABLE `{self.project_id}.{self.dataset_id}.{self.table_id}`
+            PARTITION BY DATE(import_timestamp)
+            OPTIONS (require_partition_filter = FALSE)
+            AS SELECT {projection}
+            FROM `{self.project_id}.{self.dataset_id}.{staging_table_id}`
+            """
+
+            query_job = self.client.query(query)
+            query_job.result()  # Wait for the query to complete
+
+        except Conflict:
+            logger.info(
+                "%s Table %s was created by another writer %s",
+                _SEP,
+                self.table_id,
+                _SEP,
             )
+            return False
+        except Exception:
+            logger.exception("%s Failed to create partitioned table. %s", _SEP, _SEP)
+            raise
 
-            # Create the temporary table
-            created_table = self.client.create_table(new_table)
-            logger.debug(
-                f"{'=' * 10} Created temporary partitioned table {created_table.full_table_id} {'=' * 10}"
+        else:
+            logger.info(
+                "%s Created partitioned table %s.%s.%s %s",
+                _SEP,
+                self.project_id,
+                self.dataset_id,
+                self.table_id,
+                _SEP,
             )
+            return True
 
-            # Copy data from original table to the temporary table
-            job_config = bigquery.QueryJobConfig()
-            job_config.destination = temp_table_ref
-            job_config.write_disposition = bigquery.WriteDisposition.WRITE_TRUNCATE
+        finally:
+            self._invalidate_table_cache()
 
-            query = f"""
-            SELECT * FROM `{self.project_id}.{self.dataset_id}.{self.table_id}`
-            """
+    @retry_on_transient_error()
+    def _create_new_table_with_chunk(self, gcs_uri: str) -> int | None:
+        """
+        Create a new table with schema autodetection using the first data chunk.
 
-            query_job = self.client.query(query, job_config=job_config)
-            query_job.result()  # Wait for the query to complete
+        The chunk is loaded into a staging table with schema autodetection, which
+        is then copied into the partitioned target table and deleted. A transient
+        error retries the whole step, from a new staging table.
 
-            # Delete the original table and rename the temporary one
-            self.client.delete_table(self.table_ref)
-            self.client.get_table(
-                temp_table_ref
-            )  # Ensure the temp table exists before renaming
+        Exports of the same controller create the table one at a time, and each
+        checks again whether the table exists before creating it.
 
-            # Use UPDATE DDL to rename the table
-            rename_query = f"""
-            ALTER TABLE `{self.project_id}.{self.dataset_id}.{temp_table_id}`
-            RENAME TO `{self.table_id}`
-            """
+        Args:
+            gcs_uri: GCS URI of the data file
 
-            rename_job = self.client.query(rename_query)
-            rename_job.result()
+        Returns:
+            int | None: Number of rows loaded, or None if the table already
+                exists and the chunk still has to be loaded into it
+
+        """
+        with self._table_create_lock:
+            # Another export may have created the table since it was checked
+            self._invalidate_table_cache()
+            if self._table_exists():
+                return None
 
             logger.info(
-                f"{'=' * 10} Created partitioned table {self.project_id}.{self.dataset_id}.{self.table_id} {'=' * 10}",
+                "%s Table %s does not exist. Using schema autodetection. %s",
+                _SEP,
+                self.table_id,
+                _SEP,
             )
-        except Exception:
-            logger.exception(
-                f"{'=' * 10} Failed to create partitioned table. {'=' * 10}"
+
+            # Initial load with autodetection into a staging table
+            staging_table_id = self._temp_table_id()
+            staging_table_ref = self.client.dataset(self.dataset_id).table(
+                staging_table_id
             )
-            raise
+            job_config = bigquery.LoadJobConfig(
+                autodetect=True,
+                source_format="NEWLINE_DELIMITED_JSON",
+                write_disposition="WRITE_TRUNCATE",
+            )
+            try:
+                load_job = self.client.load_table_from_uri(
+                    gcs_uri, staging_table_ref, job_config=job_config
+                )
+                load_job.result()
 
-    @retry_on_transient_error()
-    def _create_new_table_with_chunk(
-        self, gcs_uri: str, write_disposition: str
-    ) -> None:
+                # Set up partitioning
+                created = self._create_partitioned_table(staging_table_id)
+            finally:
+                self._delete_staging_table(staging_table_ref)
+
+        if not created:
+            return None
+        return load_job.output_rows or 0
+
+    def _check_merge_keys(self, merge_keys: Sequence[str]) -> None:
         """
-        Create a new table with schema autodetection using the first data chunk.
+        Check that every merge key is a column of the existing table.
 
         Args:
-            gcs_uri: GCS URI of the data file
-            write_disposition: BigQuery write disposition
+            merge_keys: Columns identifying a row
+
+        Raises:
+            ValueError: If a merge key is not a column of the table
 
         """
-        logger.info(
-            f"{'=' * 10} Table {self.table_id} does not exist. Using schema autodetection. {'=' * 10}"
-        )
+        column_names = {field.name for field in self._get_cached_table().schema}
+        missing_keys = [key for key in merge_keys if key not in column_names]
+        if missing_keys:
+            error_message = (
+                f"merge_keys not in table {self.table_id}: {', '.join(missing_keys)}"
+            )
+            raise ValueError(error_message)
 
-        # Initial load with autodetection
-        job_config = bigquery.LoadJobConfig(
-            autodetect=True,
-            source_format="NEWLINE_DELIMITED_JSON",
-            write_disposition=write_disposition,
-        )
-        load_job = self.client.load_table_from_uri(
-            gcs_uri, self.table_ref, job_config=job_config
-        )
-        load_job.result()
+    @retry_on_transient_error()
+    def _merge_from_gcs(self, gcs_uri: str, merge_keys: Sequence[str]) -> int:
+        """
+        Upsert data from GCS into the existing table with a MERGE statement.
+
+        The data is loaded into a staging table with the schema of the target
+        table. Rows whose merge keys match an existing row replace it, all other
+        rows are inserted. The staging table is deleted afterwards. BigQuery
+        rejects the MERGE if several new rows share the same merge keys.
+
+        Args:
+            gcs_uri: GCS URI of the data file(s)
+            merge_keys: Columns identifying a row
+
+        Returns:
+            int: Number of rows loaded into the staging table
 
-        # Set up partitioning
-        self._create_partitioned_table()
+        Raises:
+            Exception: If loading or merging fails
 
-        # Reload data into partitioned table
+        """
+        table = self._get_cached_table()
+        staging_table_id = self._temp_table_id()
+        staging_table_ref = self.client.dataset(self.dataset_id).table(staging_table_id)
         job_config = bigquery.LoadJobConfig(
             source_format="NEWLINE_DELIMITED_JSON",
-            write_disposition=write_disposition,
-            schema=self.client.get_table(self.table_ref).schema,
+            write_disposition="WRITE_TRUNCATE",
+            schema=table.schema,
+        )
+
+        on_clause = " AND ".join(f"T.`{key}` = S.`{key}`" for key in merge_keys)
+        update_clause = ", ".join(
+            f"`{field.name}` = S.`{field.name}`"
+            for field in table.schema
+            if field.name not in merge_keys
         )
-        load_job = self.client.load_table_from_uri(
-            gcs_uri, self.table_ref, job_config=job_config
+        when_matched = (
+            f"WHEN MATCHED THEN UPDATE SET {update_clause}" if update_clause else ""
         )
-        load_job.result()
+        query = f"""
+        MERGE `{self.project_id}.{self.dataset_id}.{self.table_id}` T
+        USING `{self.project_id}.{self.dataset_id}.{staging_table_id}` S
+        ON {on_clause}
+        {when_matched}
+        WHEN NOT MATCHED THEN INSERT ROW
+        """
+
+        try:
+            load_job = self.client.load_table_from_uri(
+                gcs_uri, staging_table_ref, job_config=job_config
+            )
+            load_job.result()
+
+            query_job = self.client.query(query)
+            query_job.result()  # Wait for the query to complete
+        except Exception as e:
+            logger.exception("%s Failed to merge data %s", _SEP, _SEP)
+            if isinstance(e, NotFound):
+                self._invalidate_table_cache()
+            raise
+        finally:
+            self._delete_staging_table(staging_table_ref)
+
+        return load_job.output_rows or 0
 
     @retry_on_transient_error()
     def _table_exists(self) -> bool:
         """
         Check if a table exists in the dataset.
 
+        The table metadata fetched for the check is kept in the table cache.
+
         Returns:
             bool: True if the table exists, False otherwise
 
@@ -394,75 +833,292 @@ class BigQueryController:
 
         """
         try:
-            self.client.get_table(self.table_ref)
+            self._get_cached_table()
         except NotFound:
             return False
         except GoogleAPIError:
-            logger.exception(f"{'=' * 10} Error checking if table exists. {'=' * 10}")
+            logger.exception("%s Error checking if table exists. %s", _SEP, _SEP)
             raise
         else:
             return True
 
     def _chunk_data(
-        self, data_list: list[dict[str, Any]]
-    ) -> list[list[dict[str, Any]]]:
+        self, data: Iterable[dict[str, Any]]
+    ) -> Iterator[list[dict[str, Any]]]:
         """
-        Split a large list of records into smaller chunks.
+        Split a large stream of records into smaller chunks.
+
+        Chunks are yielded lazily so only one of them is held in memory besides
+        the input itself.
 
         Args:
-            data_list: list of data records
+            data: data records
 
-        Returns:
-            list[list[dict[str, Any]]]: list of data chunks
+        Yields:
+            list[dict[str, Any]]: data chunk
 
         """
-        # Use cast to explicitly tell MyPy that chunk_size is an int here
-        chunk_size = cast(int, self.config["chunk_size"])
-        return [
-            data_list[i : i + chunk_size] for i in range(0, len(data_list), chunk_size)
-        ]
+        records = iter(data)
+        while chunk := list(islice(records, self.chunk_size)):
+            yield chunk
 
     @staticmethod
-    def _add_import_timestamp(json_data: dict | list[dict]) -> dict | list[dict]:
+    def _stream_with_timestamp(
+        records: Iterator[dict], import_timestamp: datetime
+    ) -> Iterator[dict]:
         """
-        Add import_timestamp field to JSON data in ISO format.
+        Add import_timestamp field to records as they are consumed.
 
         Args:
-            json_data: Original JSON data (dict or list of dicts)
+            records: Records to update
+            import_timestamp: Timestamp to add
 
-        Returns:
-            Union[dict, list[dict]]: JSON data with import_timestamp added
+        Yields:
+            dict: Record with import_timestamp added
 
-        Raises:
-            TypeError: If json_data is not a dict or list of dicts
+        """
+        for item in records:
+            item["import_timestamp"] = import_timestamp
+            yield item
 
+    @staticmethod
+    def _add_import_timestamp(
+        json_data: dict | Iterable[dict], validate: bool = False
+    ) -> dict | Iterable[dict]:
         """
-        if not isinstance(json_data, (dict, list)):
-            error_message = f"Expected dict or list, got {type(json_data).__name__}"
-            raise TypeError(error_message)
+        Add import_timestamp field to JSON data as a UTC datetime.
 
-        import_timestamp = datetime.now(UTC).isoformat()
+        The datetime is serialized to ISO format by orjson when the data is staged.
 
-        if isinstance(json_data, dict):
-            json_data["import_timestamp"] = import_timestamp
-            return json_data
+        Lists are updated in a single pass. Other iterables are wrapped lazily, so
+        the timestamp is added while the records are serialized for upload.
+
+        Args:
+            json_data: Original JSON data (dict, list of dicts or iterable of dicts)
+            validate: Check that every item of a list is a dict before updating it
+
+        Returns:
+            Union[dict, Iterable[dict]]: JSON data with import_timestamp added
+
+        Raises:
+            TypeError: If json_data is not a dict or an iterable, or if
+                validation is requested and a list item is not a dict
+
+        """
+        import_timestamp = datetime.now(UTC)
 
         if isinstance(json_data, list):
-            if not all(isinstance(item, dict) for item in json_data):
+            if validate and not all(isinstance(item, dict) for item in json_data):
                 error_message = "All items in list must be dictionaries"
                 raise TypeError(error_message)
 
             for item in json_data:
                 item["import_timestamp"] = import_timestamp
+            return json_data
+
+        if isinstance(json_data, dict):
+            json_data["import_timestamp"] = import_timestamp
+            return json_data
+
+        if isinstance(json_data, Iterable) and not isinstance(json_data, (str, bytes)):
+            return BigQueryController._stream_with_timestamp(
+                iter(json_data), import_timestamp
+            )
+
+        error_message = (
+            f"Expected dict or iterable of dicts, got {type(json_data).__name__}"
+        )
+        raise TypeError(error_message)
+
+    def _encode_rows_for_storage_write(
+        self, records: list[dict[str, Any]]
+    ) -> tuple[descriptor_pb2.DescriptorProto, list[bytes]] | None:
+        """
+        Encode records as protobuf messages matching the current table schema.
+
+        Args:
+            records: Records to encode
+
+        Returns:
+            tuple[descriptor_pb2.DescriptorProto, list[bytes]] | None: Row descriptor
+                and serialized rows, or None if the records cannot be encoded or
+                do not fit in a single append request
+
+        """
+        schema = self._get_cached_table().schema
+        try:
+            row_descriptor, row_class = _build_row_message(schema)
+            fields_by_name = {field.name: field for field in schema}
+            serialized_rows = [
+                json_format.ParseDict(
+                    _to_proto_json(fields_by_name, record), row_class()
+                ).SerializeToString()
+                for record in records
+            ]
+        except (ValueError, TypeError, json_format.ParseError) as e:
+            logger.info(
+                "%s Rows cannot be sent through the Storage Write API (%s), staging them in GCS %s",
+                _SEP,
+                e,
+                _SEP,
+            )
+            return None
+
+        if sum(len(row) for row in serialized_rows) > APPEND_ROWS_MAX_BYTES:
+            logger.info(
+                "%s Rows exceed a single Storage Write API request, staging them in GCS %s",
+                _SEP,
+                _SEP,
+            )
+            return None
+        return row_descriptor, serialized_rows
+
+    @retry_on_transient_error()
+    def _append_via_storage_write(
+        self,
+        row_descriptor: descriptor_pb2.DescriptorProto,
+        serialized_rows: list[bytes],
+    ) -> None:
+        """
+        Append rows to the table through the default Storage Write API stream.
+
+        The default stream is shared by all writers of the table and needs no
+        CreateWriteStream call, whose quota frequent small appends would exhaust.
+        The rows are sent in a single request, so they are applied together or
+        not at all. Rows become visible immediately. Delivery is at least once:
+        if an append succeeds but its response is lost, the retry adds the rows
+        a second time.
 
-        return json_data
+        Args:
+            row_descriptor: Protobuf descriptor of the rows
+            serialized_rows: Rows encoded with the descriptor
+
+        """
+        request_template = bqstorage_types.AppendRowsRequest(
+            write_stream=self.bqwrite_client.write_stream_path(
+                self.project_id, self.dataset_id, self.table_id, "_default"
+            ),
+            proto_rows=bqstorage_types.AppendRowsRequest.ProtoData(
+                writer_schema=bqstorage_types.ProtoSchema(
+                    proto_descriptor=row_descriptor
+                )
+            ),
+        )
+        append_rows_stream = bqstorage_writer.AppendRowsStream(
+            self.bqwrite_client, request_template
+        )
+
+        try:
+            request = bqstorage_types.AppendRowsRequest(
+                proto_rows=bqstorage_types.AppendRowsRequest.ProtoData(
+                    rows=bqstorage_types.ProtoRows(serialized_rows=serialized_rows)
+                ),
+            )
+            append_rows_stream.send(request).result()
+        except NotFound:
+            # The table was dropped since it was cached
+            self._invalidate_table_cache()
+            raise
+        finally:
+            append_rows_stream.close()
+
+        logger.info(
+            "%s Appended %s records to %s via the Storage Write API %s",
+            _SEP,
+            len(serialized_rows),
+            self.table_id,
+            _SEP,
+        )
 
     @retry_on_transient_error()
+    def _upload_chunk(self, chunk: list[dict[str, Any]], blob_name: str) -> str:
+        """
+        Upload one chunk to GCS as an NDJSON file.
+
+        The chunk is a list, so it can be written again when a transient error
+        interrupts the upload.
+
+        Args:
+            chunk: Records to upload
+            blob_name: Name of the file in GCS
+
+        Returns:
+            str: URI of the uploaded file in GCS
+
+        """
+        return self.storage_controller.upload_ndjson(chunk, blob_name)
+
+    def _upload_chunks_in_parallel(
+        self, chunks: Iterator[list[dict[str, Any]]], file_prefix: str
+    ) -> list[str]:
+        """
+        Stream chunks to GCS concurrently as numbered NDJSON files.
+
+        At most ``max_parallel_chunks`` uploads are in flight at any time, and the
+        next chunk is only taken from the iterator once a slot is free. After the
+        first failure no further chunk is taken, pending uploads are cancelled,
+        the files already uploaded are deleted and the error is re-raised.
+
+        Args:
+            chunks: Chunks to upload
+            file_prefix: Common prefix of the file names, followed by ``_<index>.ndjson``
+
+        Returns:
+            list[str]: URIs of the uploaded files in chunk order
+
+        """
+        max_workers = self.max_parallel_chunks
+        in_flight = threading.BoundedSemaphore(max_workers)
+        failed = threading.Event()
+        gcs_uris: dict[int, str] = {}
+
+        def on_done(future: Future[str]) -> None:
+            # Flag the failure before freeing the slot, so the submitting loop
+            # sees it as soon as it can take the next chunk
+            if future.cancelled() or future.exception() is not None:
+                failed.set()
+            in_flight.release()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures: dict[Future[str], int] = {}
+            try:
+                for i, chunk in enumerate(chunks):
+                    in_flight.acquire()
+                    if failed.is_set():
+                        break
+                    future = executor.submit(
+                        self._upload_chunk,
+                        chunk,
+                        f"{file_prefix}_{i:05d}.ndjson",
+                    )
+                    future.add_done_callback(on_done)
+                    futures[future] = i
+
+                for future in as_completed(futures):
+                    gcs_uris[futures[future]] = future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                # Let the running uploads finish, then remove what they wrote
+                wait(futures)
+                uploaded_uris = [
+                    future.result()
+                    for future in futures
+                    if not future.cancelled() and future.exception() is None
+                ]
+                if uploaded_uris:
+                    self.storage_controller.delete_files(uploaded_uris)
+                raise
+
+        return [gcs_uris[i] for i in sorted(gcs_uris)]
+
     def export_to_bigquery(
         self,
-        json_data: dict[str, Any] | list[dict[str, Any]],
+        json_data: dict[str, Any] | Iterable[dict[str, Any]],
         write_disposition: str = "WRITE_APPEND",
         delete_gcs_file: bool = True,
+        on_conflict: Literal["append", "upsert"] = "append",
+        merge_keys: Sequence[str] | None = None,
     ) -> list[str]:
         """
         Export JSON data to BigQuery via Cloud Storage.
@@ -470,16 +1126,25 @@ class BigQueryController:
         Features:
         - For new tables: Uses schema autodetection
         - For existing tables: Uses existing schema
+        - Small appends to existing tables go through the Storage Write API
+        - Upserts into existing tables are applied with a single MERGE
         - Handles large datasets by chunking
-        - Includes retry logic for transient errors
+        - Retries each upload and load step on transient errors, so records of a
+          one-shot iterator are never read twice
 
         Args:
-            json_data: JSON data to load (dict or list of dicts)
+            json_data: JSON data to load (dict, or list or other iterable of dicts).
+                Iterables other than lists are consumed lazily, one chunk at a time.
             write_disposition: BigQuery write disposition (WRITE_APPEND, WRITE_TRUNCATE, WRITE_EMPTY)
             delete_gcs_file: Whether to delete the staging file after loading
+            on_conflict: "append" adds all rows, "upsert" replaces the rows of an
+                existing table whose merge_keys match and inserts the others.
+                A table that does not exist yet is created from the data as is.
+            merge_keys: Columns identifying a row, required for "upsert". Each must
+                be a column of the table, a single name must be given as a list.
 
         Returns:
-            list[str]: URIs of the files in GCS
+            list[str]: URIs of the files in GCS (empty if no file was staged)
 
         Raises:
             ValueError: For invalid input data
@@ -493,95 +1158,263 @@ class BigQueryController:
                 error_message = f"Invalid write_disposition. Must be one of {', '.join(valid_dispositions)}"
                 raise ValueError(error_message)
 
+            # Validate conflict handling
+            if on_conflict not in ("append", "upsert"):
+                error_message = "Invalid on_conflict. Must be one of append, upsert"
+                raise ValueError(error_message)
+            if on_conflict == "upsert":
+                if not merge_keys:
+                    error_message = "merge_keys must be provided for upserts"
+                    raise ValueError(error_message)
+                if isinstance(merge_keys, str):
+                    error_message = (
+                        "merge_keys must be a sequence of column names, not a string"
+                    )
+                    raise ValueError(error_message)
+                if write_disposition != "WRITE_APPEND":
+                    error_message = "Upserts require the WRITE_APPEND write_disposition"
+                    raise ValueError(error_message)
+
             # Add import_timestamp to the data
             json_data_with_timestamp = BigQueryController._add_import_timestamp(
                 json_data
             )
 
-            # Ensure we have a list
-            data_list = (
-                json_data_with_timestamp
-                if isinstance(json_data_with_timestamp, list)
-                else [json_data_with_timestamp]
+            # Ensure we have an iterable of records
+            records = (
+                [json_data_with_timestamp]
+                if isinstance(json_data_with_timestamp, dict)
+                else json_data_with_timestamp
             )
+
+            # Split the data into chunks, each staged as its own file
+            chunks = self._chunk_data(records)
+            first_chunk = next(chunks, None)
+
             # Return early if there's no data to process
-            if not data_list:
+            if first_chunk is None:
                 logger.info(
-                    f"{'=' * 10} No data to process, skipping BigQuery export {'=' * 10}"
+                    "%s No data to process, skipping BigQuery export %s", _SEP, _SEP
                 )
                 return []
+            chunks = chain([first_chunk], chunks)
 
-            # Check if we need to chunk the data
-            # Use cast to explicitly tell MyPy that chunk_size is an int here
-            chunk_size = cast(int, self.config["chunk_size"])
-            chunks = (
-                self._chunk_data(data_list)
-                if len(data_list) > chunk_size
-                else [data_list]
-            )
-            logger.info(
-                f"{'=' * 10} Processing {len(data_list)} records in {len(chunks)} chunks {'=' * 10}"
-            )
+            if isinstance(records, list):
+                logger.info(
+                    "%s Processing %s records in %s chunks %s",
+                    _SEP,
+                    len(records),
+                    math.ceil(len(records) / self.chunk_size),
+                    _SEP,
+                )
+            else:
+                logger.info(
+                    "%s Processing streamed records in chunks of %s %s",
+                    _SEP,
+                    self.chunk_size,
+                    _SEP,
+                )
 
-            # Check if table exists
+            # Check if table exists, with metadata fetched fresh for this export
+            # in case the table was changed outside this controller
+            self._invalidate_table_cache()
             table_existed = self._table_exists()
 
+            # Only rows of an existing table can conflict with the new ones
+            upsert = on_conflict == "upsert" and table_existed
+            if upsert:
+                self._check_merge_keys(merge_keys)
+
+            # Small appends to an existing table are written straight into it
+            # with the Storage Write API instead of being staged in GCS
+            if (
+                table_existed
+                and not upsert
+                and write_disposition == "WRITE_APPEND"
+                and isinstance(records, list)
+                and len(records) <= self.storage_write_max_records
+            ):
+                encoded_rows = self._encode_rows_for_storage_write(records)
+                if encoded_rows is not None:
+                    self._append_via_storage_write(*encoded_rows)
+                    return []
+
+            # Common prefix of the staging files of this export
+            batch_id = (
+                f"{int(time.time())}_{os.getpid()}_{next(_batch_counter)}"
+                f"_{secrets.token_hex(4)}"
+            )
+            file_prefix = f"{self.table_id}_data_{batch_id}"
+
             # URIs of the uploaded files
             gcs_uris = []
 
-            # Process each chunk
-            for i, chunk in enumerate(chunks):
-                # Skip empty chunks
-                if not chunk:
-                    logger.info(f"{'=' * 10} Skipping empty chunk {i} {'=' * 10}")
-                    continue
-                # Generate a unique identifier for the chunk file
-                chunk_id = f"{uuid.uuid4().hex[:8]}_{i}"
-
-                # Upload the chunk to GCS
-                gcs_uri = self.storage_controller.upload_to_gcs(
-                    chunk, prefix=f"{self.table_id}_data_{chunk_id}"
+            # Rows reported by the load jobs
+            loaded_rows = 0
+
+            # A new table needs its schema from the first chunk, and WRITE_TRUNCATE /
+            # WRITE_EMPTY must only apply once, so that chunk is loaded on its own.
+            if not table_existed or write_disposition != "WRITE_APPEND":
+                gcs_uri = self._upload_chunk(
+                    next(chunks), f"{file_prefix}_first.ndjson"
                 )
                 gcs_uris.append(gcs_uri)
 
-                if not table_existed and i == 0:
+                if not table_existed:
                     # For the first chunk of a new table: use schema autodetection
-                    self._create_new_table_with_chunk(gcs_uri, write_disposition)
-                    table_existed = True  # Table now exists for subsequent chunks
+                    created_rows = self._create_new_table_with_chunk(gcs_uri)
+                    if created_rows is None:
+                        # Another export created the table in the meantime
+                        table_existed = True
+                        upsert = on_conflict == "upsert"
+                        if upsert:
+                            self._check_merge_keys(merge_keys)
+                    else:
+                        loaded_rows += created_rows
+
+                if table_existed and upsert:
+                    loaded_rows += self._merge_from_gcs(gcs_uri, merge_keys)
+                elif table_existed:
+                    loaded_rows += self._load_data_from_gcs(gcs_uri, write_disposition)
+
+            # Remaining chunks are uploaded in parallel and appended or merged with
+            # a single wildcard job, letting BigQuery read the files in parallel
+            part_uris = self._upload_chunks_in_parallel(chunks, f"{file_prefix}_part")
+            if part_uris:
+                gcs_uris.extend(part_uris)
+                parts_uri = f"gs://{self.bucket_name}/{file_prefix}_part_*.ndjson"
+                if upsert:
+                    loaded_rows += self._merge_from_gcs(parts_uri, merge_keys)
                 else:
-                    # For existing tables or subsequent chunks: use current schema
-                    self._load_data_from_gcs(gcs_uri, write_disposition)
+                    loaded_rows += self._load_data_from_gcs(parts_uri, "WRITE_APPEND")
 
-                # Clean up staging file if requested
-                if delete_gcs_file:
-                    self.storage_controller.delete_file(gcs_uri)
+            # Clean up staging files if requested
+            if delete_gcs_file:
+                self.storage_controller.delete_files(gcs_uris)
 
             # If we processed any data, log results
             if gcs_uris:
-                table = self.client.get_table(self.table_ref)
                 logger.info(
-                    f"{'=' * 10} Loaded {len(data_list)} records into {self.table_id} {'=' * 10}"
-                )
-                logger.info(
-                    f"{'=' * 10} Table {self.table_id} now has {table.num_rows} rows {'=' * 10}"
+                    "%s Loaded %s records from %s files into %s %s",
+                    _SEP,
+                    loaded_rows,
+                    len(gcs_uris),
+                    self.table_id,
+                    _SEP,
                 )
 
         except Exception:
-            logger.exception(
-                f"{'=' * 10} Failed to export data to BigQuery. {'=' * 10}"
-            )
+            logger.exception("%s Failed to export data to BigQuery. %s", _SEP, _SEP)
             raise
 
         else:
             return gcs_uris
 
+    async def export_to_bigquery_async(
+        self,
+        json_data: dict[str, Any] | Iterable[dict[str, Any]],
+        write_disposition: str = "WRITE_APPEND",
+        delete_gcs_file: bool = True,
+        on_conflict: Literal["append", "upsert"] = "append",
+        merge_keys: Sequence[str] | None = None,
+    ) -> list[str]:
+        """
+        Export JSON data to BigQuery without blocking the running event loop.
+
+        The export runs ``export_to_bigquery`` in a worker thread, so several
+        exports can be awaited concurrently, e.g. with ``asyncio.gather``. If the
+        table does not exist yet, the first of them creates it and the others
+        load into it.
+
+        Args:
+            json_data: JSON data to load (dict, or list or other iterable of dicts).
+            write_disposition: BigQuery write disposition (WRITE_APPEND, WRITE_TRUNCATE, WRITE_EMPTY)
+            delete_gcs_file: Whether to delete the staging file after loading
+            on_conflict: "append" adds all rows, "upsert" merges them on merge_keys
+            merge_keys: Columns identifying a row, required for "upsert"
+
+        Returns:
+            list[str]: URIs of the files in GCS (empty if no file was staged)
+
+        """
+        return await asyncio.to_thread(
+            self.export_to_bigquery,
+            json_data,
+            write_disposition,
+            delete_gcs_file,
+            on_conflict,
+            merge_keys,
+        )
+
+    @property
+    def bqstorage_client(self) -> bigquery_storage.BigQueryReadClient:
+        """
+        Return the BigQuery Storage Read API client, creating it on first access.
+
+        The client is cached on the controller so repeated queries reuse the same
+        gRPC channel.
+
+        Returns:
+            bigquery_storage.BigQueryReadClient: Storage Read API client
+
+        """
+        if self._bqstorage_client is None:
+            self._bqstorage_client = bigquery_storage.BigQueryReadClient(
+                credentials=self.client._credentials
+            )
+        return self._bqstorage_client
+
+    @property
+    def bqwrite_client(self) -> bigquery_storage.BigQueryWriteClient:
+        """
+        Return the BigQuery Storage Write API client, creating it on first access.
+
+        Returns:
+            bigquery_storage.BigQueryWriteClient: Storage Write API client
+
+        """
+        if self._bqwrite_client is None:
+            self._bqwrite_client = bigquery_storage.BigQueryWriteClient(
+                credentials=self.client._credentials
+            )
+        return self._bqwrite_client
+
+    @retry_on_transient_error()
+    def execute_query_to_arrow(self, query: str) -> pa.Table:
+        """
+        Execute a SQL query and return results as a pyarrow Table.
+
+        Results are downloaded through the BigQuery Storage Read API as Arrow
+        record batches, which is considerably faster than paging through the
+        REST API for large result sets.
+
+        Args:
+            query: SQL query to execute
+
+        Returns:
+            pa.Table: Query results as a pyarrow Table
+
+        Raises:
+            Exception: If query execution fails
+
+        """
+        try:
+            query_job = self.client.query(query)
+            results = query_job.result()
+            return results.to_arrow(bqstorage_client=self.bqstorage_client)
+        except Exception:
+            logger.exception("%s Query execution failed. %s", _SEP, _SEP)
+            raise
+
     @retry_on_transient_error()
-    def execute_query(self, query: str) -> list[dict]:
+    def execute_query(self, query: str, use_storage_api: bool = True) -> list[dict]:
         """
         Execute a SQL query and return results as a list of dictionaries.
 
         Args:
             query: SQL query to execute
+            use_storage_api: Download results via the BigQuery Storage Read API
+                instead of building a dict per row from the REST API
 
         Returns:
             list[dict]: Query results as a list of dictionaries
@@ -593,7 +1426,11 @@ class BigQueryController:
         try:
             query_job = self.client.query(query)
             results = query_job.result()
+            if use_storage_api:
+                return results.to_arrow(
+                    bqstorage_client=self.bqstorage_client
+                ).to_pylist()
             return [dict(row) for row in results]
         except Exception:
-            logger.exception(f"{'=' * 10} Query execution failed. {'=' * 10}")
+            logger.exception("%s Query execution failed. %s", _SEP, _SEP)
             raise
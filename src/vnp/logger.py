@@ -6,13 +6,31 @@ with consistent settings to ensure uniform logging behavior.
 """
 
 import logging
+import threading
 from logging import Logger
 
+# Formatter shared by every handler created by this module
+_FORMATTER = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+
+def _new_handler() -> logging.Handler:
+    """
+    Create a console handler using the shared formatter.
+
+    Returns:
+        A StreamHandler writing to stderr.
+
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(_FORMATTER)
+    return handler
+
 
 class LoggerConfigurator:
     """A class to manage logger configuration state and operations."""
 
     _library_loggers_configured: bool = False
+    _lock = threading.Lock()
 
     @classmethod
     def _configure_library_loggers(cls, level: int) -> None:
@@ -41,13 +59,7 @@ class LoggerConfigurator:
             for handler in lib_logger.handlers[:]:
                 lib_logger.removeHandler(handler)
             lib_logger.setLevel(level)
-
-            console_handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            )
-            console_handler.setFormatter(formatter)
-            lib_logger.addHandler(console_handler)
+            lib_logger.addHandler(_new_handler())
             # Prevent propagation to avoid root logger handling if configured elsewhere
             lib_logger.propagate = False
 
@@ -58,6 +70,8 @@ class LoggerConfigurator:
 
         Initializes logging configuration on first call, including root logger setup
         and third-party library configuration. Subsequent calls return existing loggers.
+        Configuration is guarded by a lock so concurrent first calls do not install
+        duplicate handlers.
 
         Args:
             name: The name of the logger to retrieve/create.
@@ -67,43 +81,34 @@ class LoggerConfigurator:
             A configured Logger instance with the specified name.
 
         """
-        if not cls._library_loggers_configured:
-            # Configure root logger first to ensure base configuration
-            root_logger = logging.getLogger()
-            root_logger.setLevel(level)
-
-            # Clear root logger handlers if any to avoid duplicates
-            for handler in root_logger.handlers[:]:
-                root_logger.removeHandler(handler)
-
-            # Setup console handler for root logger
-            console_handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            )
-            console_handler.setFormatter(formatter)
-            root_logger.addHandler(console_handler)
-
-            # Configure third-party loggers
-            cls._configure_library_loggers(level)
-            cls._library_loggers_configured = True
-
-        # Get the requested logger
-        logger = logging.getLogger(name)
-        logger.setLevel(level)
-
-        # Prevent adding multiple handlers if logger is reused
-        if not logger.handlers:
-            # Use the same handler as root logger to maintain consistency
-            console_handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            )
-            console_handler.setFormatter(formatter)
-            logger.addHandler(console_handler)
-
-        # Prevent propagation to avoid double logging from ancestor handlers
-        logger.propagate = False
+        with cls._lock:
+            if not cls._library_loggers_configured:
+                # Configure root logger first to ensure base configuration
+                root_logger = logging.getLogger()
+                root_logger.setLevel(level)
+
+                # Clear root logger handlers if any to avoid duplicates
+                for handler in root_logger.handlers[:]:
+                    root_logger.removeHandler(handler)
+
+                # Setup console handler for root logger
+                root_logger.addHandler(_new_handler())
+
+                # Configure third-party loggers
+                cls._configure_library_loggers(level)
+                cls._library_loggers_configured = True
+
+            # Get the requested logger
+            logger = logging.getLogger(name)
+            logger.setLevel(level)
+
+            # Prevent adding multiple handlers if logger is reused
+            if not logger.handlers:
+                # Use the same handler setup as root logger to maintain consistency
+                logger.addHandler(_new_handler())
+
+            # Prevent propagation to avoid double logging from ancestor handlers
+            logger.propagate = False
 
         return logger
 
@@ -6,19 +6,44 @@ This module provides a class for interacting with Google Cloud Secret Manager.
 
 from __future__ import annotations
 
+from functools import cache
+from typing import TYPE_CHECKING
+
+from google.api_core.exceptions import NotFound
 from google.cloud import secretmanager
 
 from vnp.logger import get_logger
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 logger = get_logger(__name__)
 
+# Banner around log messages
+_SEP = "=" * 10
+
+
+@cache
+def _secret_manager_client() -> secretmanager.SecretManagerServiceClient:
+    """
+    Return the Secret Manager client shared by all SecretManager instances.
+
+    The client and its credentials are created on first use and cached for the
+    lifetime of the process.
+
+    Returns:
+        secretmanager.SecretManagerServiceClient: The shared client.
+
+    """
+    return secretmanager.SecretManagerServiceClient()
+
 
 class SecretManager:
     """
     A class to interact with Google Cloud Secret Manager.
 
     Attributes:
-        client (secretmanager.SecretManagerServiceClient): The client for interacting with Secret Manager.
+        client (secretmanager.SecretManagerServiceClient): The client for interacting with Secret Manager, shared across instances.
         project_id (str): The ID of the Google Cloud project.
 
     """
@@ -31,7 +56,7 @@ class SecretManager:
             project_id: The ID of your Google Cloud project.
 
         """
-        self.client = secretmanager.SecretManagerServiceClient()
+        self.client = _secret_manager_client()
         self.project_id = project_id
         self.parent = f"projects/{project_id}"
 
@@ -47,61 +72,58 @@ class SecretManager:
             The secret data as bytes.
 
         """
-        logger.info(f"{'=' * 10} Retrieving secret from GCP. {'=' * 10}")
+        logger.info("%s Retrieving secret from GCP. %s", _SEP, _SEP)
         name = f"{self.parent}/secrets/{secret_id}/versions/{version}"
         response = self.client.access_secret_version(name=name)
         return response.payload.data
 
     def add_secret(
         self, secret_id: str, secret_data: bytes, labels: dict | None = None
-    ) -> secretmanager.Secret:
+    ) -> secretmanager.SecretVersion:
         """
         Add a new secret or a new version to an existing secret.
 
+        A new version is added directly; the secret is only created when it does
+        not exist yet. Labels are applied when the secret is created.
+
         Args:
             secret_id: The ID of the secret to create or update.
             secret_data: The secret data as bytes.
             labels: An optional dictionary of labels to associate with the secret.
 
         Returns:
-            The created or updated Secret object.
+            The added SecretVersion object.
 
         Raises:
             Exception: If an unexpected error occurs during secret creation or version addition.
 
         """
-        logger.info(f"{'=' * 10} Adding secret to GCP {'=' * 10}")
+        logger.info("%s Adding secret to GCP %s", _SEP, _SEP)
         secret_name = f"{self.parent}/secrets/{secret_id}"
+        payload = secretmanager.SecretPayload(data=secret_data)
+        try:
+            # Adding a version to an existing secret is the common case
+            return self.client.add_secret_version(parent=secret_name, payload=payload)
+        except NotFound:
+            logger.info("Secret %s not found, creating a new one", secret_id)
+        except Exception:
+            logger.exception("Error adding/updating secret %s.", secret_id)
+            raise
+
         try:
-            # Try to get the secret to check if it already exists
-            self.client.get_secret(name=secret_name)
-            logger.info(f"Secret {secret_id} already exists, adding a new version")
-            # Secret exists, so add a new version
-            payload = secretmanager.SecretPayload(data=secret_data)
-            response = self.client.add_secret_version(
-                parent=secret_name, payload=payload
+            # Secret does not exist, create a new one
+            secret = secretmanager.Secret(
+                replication=secretmanager.Replication(
+                    automatic=secretmanager.Replication.Automatic()
+                ),
+                labels=labels if labels else {},
             )
-            return self.client.get_secret(
-                name=secret_name
-            )  # Return the updated secret object
-
-        except Exception as e:
-            if "not found" in str(e).lower():
-                logger.info(f"Secret {secret_id} not found, creating a new one")
-                # Secret does not exist, create a new one
-                secret = secretmanager.Secret(
-                    replication=secretmanager.Replication(
-                        automatic=secretmanager.Replication.Automatic()
-                    ),
-                    labels=labels if labels else {},
-                )
-                response = self.client.create_secret(
-                    parent=self.parent, secret_id=secret_id, secret=secret
-                )
-                payload = secretmanager.SecretPayload(data=secret_data)
-                self.client.add_secret_version(parent=secret_name, payload=payload)
-                return response
-            logger.exception(f"Error adding/updating secret {secret_id}.")
+            self.client.create_secret(
+                parent=self.parent, secret_id=secret_id, secret=secret
+            )
+            return self.client.add_secret_version(parent=secret_name, payload=payload)
+        except Exception:
+            logger.exception("Error adding/updating secret %s.", secret_id)
             raise
 
     def delete_secret(self, secret_id: str) -> None:
@@ -112,17 +134,27 @@ class SecretManager:
             secret_id: The ID of the secret to delete.
 
         """
-        logger.warning(f"{'=' * 10} Deleting secret from GCP {'=' * 10}")
+        logger.warning("%s Deleting secret from GCP %s", _SEP, _SEP)
         name = f"{self.parent}/secrets/{secret_id}"
         self.client.delete_secret(name=name)
 
-    def list_secrets(self) -> list[secretmanager.Secret]:
+    def list_secrets(self, page_size: int = 250) -> Iterable[secretmanager.Secret]:
         """
         List all secrets in the project.
 
+        Returns the pager from the client, so secrets are fetched lazily, one page
+        at a time, while the result is iterated. Wrap the result in ``list()`` to
+        load all of them at once.
+
+        Args:
+            page_size: Number of secrets fetched per request (server maximum: 250).
+
         Returns:
-            A list of Secret objects.
+            An iterable pager over Secret objects.
 
         """
-        logger.info(f"{'=' * 10} Listing secrets from GCP {'=' * 10}")
-        return self.client.list_secrets(parent=self.parent)
+        logger.info("%s Listing secrets from GCP %s", _SEP, _SEP)
+        request = secretmanager.ListSecretsRequest(
+            parent=self.parent, page_size=page_size
+        )
+        return self.client.list_secrets(request=request)
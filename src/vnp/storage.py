@@ -6,21 +6,403 @@ This module provides a class for interacting with Google Cloud Storage.
 
 from __future__ import annotations
 
+import asyncio
+import errno
+import gzip
+import io
+import secrets
+import shutil
+import sys
 import tempfile
-import uuid
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Literal, Self
 
+import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as pa_feather
+import pyarrow.parquet as pa_parquet
 from google.cloud import storage
 from google.cloud.exceptions import GoogleCloudError, NotFound
+from google.cloud.storage import transfer_manager
 from google.oauth2.service_account import Credentials
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from vnp.logger import get_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Buffer, Callable, Iterable
+    from typing import BinaryIO
+
+    from google.cloud.storage.fileio import BlobWriter
     from google.oauth2.service_account import Credentials
 
+logger = get_logger(__name__)
+
+# Banner around log messages
+_SEP = "=" * 10
+
+# Resumable upload chunk size, must be a multiple of 256 KiB
+UPLOAD_CHUNK_SIZE = 32 * 256 * 1024
+
+# Client-side checksum of uploads. Staged files are validated by the jobs
+# loading them, so hashing every byte on the client is skipped.
+UPLOAD_CHECKSUM = None
+
+# Rough size of one "key":value pair written by DataFrame.to_json
+JSON_BYTES_PER_CELL = 32
+
+# DataFrames taking at least this much memory are uploaded in parallel parts
+PARALLEL_UPLOAD_THRESHOLD = 128 * 1024 * 1024
+
+# RAM-backed directory for temporary files on Linux
+SHM_DIR = Path("/dev/shm")
+
+# Maximum number of calls in a single GCS batch request
+DELETE_BATCH_SIZE = 100
+
+# File extension and content type of each supported upload format
+FILE_FORMATS: dict[str, tuple[str, str]] = {
+    "ndjson": (".json", "application/json"),
+    "parquet": (".parquet", "application/vnd.apache.parquet"),
+    "feather": (".feather", "application/vnd.apache.arrow.file"),
+}
+
+# Connection pool of each Storage client, sized for concurrent uploads and deletes
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 64
+
+# Storage clients shared by all controllers, keyed by project and credentials
+# object. Each entry keeps its credentials alive, so their id is not reused
+# while cached. The least recently used client is dropped beyond the maximum size.
+_CLIENT_CACHE_MAXSIZE = 16
+_CLIENT_CACHE: OrderedDict[tuple[str, int], tuple[Credentials, storage.Client]] = (
+    OrderedDict()
+)
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _storage_client(project_id: str, credentials: Credentials) -> storage.Client:
+    """
+    Return the shared Storage client of a project and credentials.
+
+    Clients are only shared by controllers using the same credentials object,
+    so credentials differing in subject or scopes never share a client.
+
+    Args:
+        project_id: Google Cloud project ID
+        credentials: Google service account credentials
+
+    Returns:
+        storage.Client: Cached Storage client
+
+    """
+    key = (project_id, id(credentials))
+    with _CLIENT_CACHE_LOCK:
+        cached = _CLIENT_CACHE.get(key)
+        if cached is not None:
+            _CLIENT_CACHE.move_to_end(key)
+            return cached[1]
+
+        client = storage.Client(credentials=credentials, project=project_id)
+        # Keep enough connections open for parallel requests to reuse them
+        # instead of opening a new TLS connection each time
+        client._http.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=HTTP_POOL_CONNECTIONS,
+                pool_maxsize=HTTP_POOL_MAXSIZE,
+                max_retries=Retry(total=5, backoff_factor=0.2),
+            ),
+        )
+        _CLIENT_CACHE[key] = (credentials, client)
+        if len(_CLIENT_CACHE) > _CLIENT_CACHE_MAXSIZE:
+            _CLIENT_CACHE.popitem(last=False)
+    return client
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Convert values orjson cannot serialize natively.
+
+    Missing values (pd.NA, NaT, ...) become null.
+
+    Args:
+        value: Value rejected by orjson
+
+    Returns:
+        Any: JSON serializable replacement of the value
+
+    Raises:
+        TypeError: If the value has no JSON representation
+
+    """
+    if pd.api.types.is_scalar(value) and pd.isna(value):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, np.generic):
+        return value.item()
+    error_message = f"Type is not JSON serializable: {type(value).__name__}"
+    raise TypeError(error_message)
+
+
+def _ndjson_line(record: dict) -> bytes:
+    """
+    Encode a record as one line of newline-delimited JSON.
+
+    Args:
+        record: Record to encode
+
+    Returns:
+        bytes: JSON object followed by a newline
+
+    """
+    return orjson.dumps(
+        record,
+        default=_json_default,
+        option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY,
+    )
+
+
+def _temp_dir(expected_size: int) -> str | None:
+    """
+    Choose the directory of a temporary file of about the given size.
+
+    Uses the RAM-backed /dev/shm on Linux when it has room for four times the
+    expected size, otherwise the default temporary directory. The margin covers
+    NDJSON repeating the column names on every row.
+
+    Args:
+        expected_size: Estimated size of the file in bytes
+
+    Returns:
+        str | None: Directory path, None for the default temporary directory
+
+    """
+    if (
+        sys.platform.startswith("linux")
+        and SHM_DIR.is_dir()
+        and shutil.disk_usage(SHM_DIR).free >= 4 * expected_size
+    ):
+        return str(SHM_DIR)
+    return None
+
+
+def _encodes_as_flat_records(data: pd.DataFrame) -> bool:
+    """
+    Check whether pandas can write a DataFrame as NDJSON by splitting records.
+
+    Integer, boolean and datetime values never contain ``},{``, and neither do
+    unique column labels without braces, so the records of ``to_json`` can be
+    split on it. Floats are excluded because ``to_json`` rounds them.
+
+    Args:
+        data: DataFrame to check
+
+    Returns:
+        bool: True if the fast pandas encoder can be used
+
+    """
+    return (
+        data.columns.is_unique
+        and all(
+            isinstance(name, (str, int)) and not any(c in str(name) for c in "{}")
+            for name in data.columns
+        )
+        and all(
+            pd.api.types.is_integer_dtype(dtype)
+            or pd.api.types.is_bool_dtype(dtype)
+            or pd.api.types.is_datetime64_any_dtype(dtype)
+            for dtype in data.dtypes
+        )
+    )
+
+
+def _unique_blob_name(prefix: str, extension: str) -> str:
+    """
+    Generate a unique, roughly time-ordered blob name.
+
+    Args:
+        prefix: Prefix of the name
+        extension: File extension, including the dot
+
+    Returns:
+        str: Blob name
+
+    """
+    return f"{prefix}_{int(time.time() * 1000):x}_{secrets.token_hex(6)}{extension}"
+
+
+# Per-thread buffer reused by consecutive _BlobSink instances
+_thread_buffers = threading.local()
+
+
+def _acquire_buffer() -> io.BytesIO:
+    """
+    Take the buffer of the current thread, or a new one if it is in use.
+
+    The buffer is rewound but not truncated, so its memory is kept between
+    uploads. Only the bytes before the current position are meaningful.
+
+    Returns:
+        io.BytesIO: Buffer positioned at its start
+
+    """
+    buffer = _thread_buffers.__dict__.pop("buffer", None)
+    if buffer is None:
+        return io.BytesIO()
+    buffer.seek(0)
+    return buffer
+
+
+def _release_buffer(buffer: io.BytesIO) -> None:
+    """
+    Return a buffer to the current thread for reuse.
+
+    Buffers that grew beyond ``UPLOAD_CHUNK_SIZE``, e.g. through a single large
+    write, are dropped so each thread keeps at most that much memory alive.
+
+    Args:
+        buffer: Buffer taken with _acquire_buffer
+
+    """
+    with buffer.getbuffer() as view:
+        size = view.nbytes
+    if size <= UPLOAD_CHUNK_SIZE:
+        _thread_buffers.buffer = buffer
+
+
+class _BlobSink(io.RawIOBase):
+    """
+    Writable file uploading its content to a blob when closed.
+
+    Writes are buffered in memory and sent with a single request on close.
+    Once more than ``UPLOAD_CHUNK_SIZE`` bytes have been written, the sink
+    switches to a resumable upload and streams the rest. Leaving a ``with``
+    block because of an exception cancels the upload, so no partial object is
+    created. The memory buffer is reused by the next sink of the same thread.
+
+    """
+
+    def __init__(self, blob: storage.Blob, **upload_kwargs: Any) -> None:
+        """
+        Initialize an empty sink.
+
+        Args:
+            blob: Blob to upload to
+            **upload_kwargs: Upload options such as content_type
+
+        """
+        super().__init__()
+        self._blob = blob
+        self._upload_kwargs = upload_kwargs
+        self._buffer: io.BytesIO | None = _acquire_buffer()
+        self._writer: BlobWriter | None = None
+        self._position = 0
+
+    def writable(self) -> bool:
+        """Return True, the sink is write-only."""
+        return True
+
+    def tell(self) -> int:
+        """Return the number of bytes written so far."""
+        return self._position
+
+    def write(self, b: Buffer) -> int:
+        """
+        Write bytes to the sink.
+
+        Args:
+            b: Bytes to write
+
+        Returns:
+            int: Number of bytes written
+
+        """
+        if self._buffer is None:
+            written = self._writer.write(b)
+        else:
+            written = self._buffer.write(b)
+            if self._position + written > UPLOAD_CHUNK_SIZE:
+                self._writer = self._blob.open(
+                    "wb", chunk_size=UPLOAD_CHUNK_SIZE, **self._upload_kwargs
+                )
+                size = self._buffer.tell()
+                self._buffer.seek(0)
+                self._writer.write(self._buffer.read(size))
+                self._release_buffer()
+        self._position += written
+        return written
+
+    def _release_buffer(self) -> None:
+        """Hand the memory buffer back to the thread for the next sink."""
+        if self._buffer is not None:
+            _release_buffer(self._buffer)
+            self._buffer = None
+
+    def _terminate_writer(self) -> None:
+        """
+        Cancel the resumable upload, if one was started.
+
+        A BlobWriter that is dropped while still open commits its buffered data
+        when it is garbage collected, so it must be terminated instead.
+
+        """
+        if self._writer is None:
+            return
+        writer, self._writer = self._writer, None
+        try:
+            writer.terminate()
+        except Exception:
+            logger.warning(
+                "Could not cancel the resumable upload of %s",
+                self._blob.name,
+                exc_info=True,
+            )
+            # Close the buffer anyway, so the writer cannot finish the upload
+            writer._buffer.close()
+
+    def close(self) -> None:
+        """Finish the upload and close the sink."""
+        if self.closed:
+            return
+        try:
+            if self._buffer is None:
+                try:
+                    self._writer.close()
+                except BaseException:
+                    self._terminate_writer()
+                    raise
+            else:
+                self._buffer.seek(0)
+                self._blob.upload_from_file(
+                    self._buffer, size=self._position, **self._upload_kwargs
+                )
+        finally:
+            self._writer = None
+            self._release_buffer()
+            super().close()
+
+    def __exit__(self, exc_type: object, *exc_info: object) -> None:
+        """Finish the upload, unless the block raised an exception."""
+        if exc_type is None:
+            self.close()
+        else:
+            # Abandon the data without committing any part of it
+            self._terminate_writer()
+            self._release_buffer()
+            super().close()
+
 
 class StorageController:
     """
@@ -30,100 +412,478 @@ class StorageController:
         project_id (str): Google Cloud project ID
         bucket_name (str): Cloud Storage bucket name
         credentials: Google service account credentials
+        max_workers (int): Threads uploading the parts of a parallel upload
+        chunk_size (int): Size in bytes of the parts of a parallel upload
 
     """
 
     def __init__(
-        self, project_id: str, bucket_name: str, credentials: Credentials
+        self,
+        project_id: str,
+        bucket_name: str,
+        credentials: Credentials,
+        max_workers: int = 8,
+        chunk_size: int = 32 * 1024 * 1024,
     ) -> None:
         """
-        Initialize the Cloud Storage client and get or create the bucket.
+        Initialize the Cloud Storage client and the bucket handle.
+
+        No request is made here: the bucket is created on the first upload that
+        finds it missing, or explicitly with ``ensure_bucket``.
 
         Args:
             project_id: Google Cloud project ID
             bucket_name: Cloud Storage bucket name
             credentials: Google service account credentials
+            max_workers: Threads uploading the parts of a parallel upload
+            chunk_size: Size in bytes of the parts of a parallel upload
 
         """
         self.project_id = project_id
         self.bucket_name = bucket_name
         self.credentials = credentials
-        self.logger = get_logger(__name__)
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
 
-        # Initialize the Storage client
-        self.storage_client = storage.Client(
-            credentials=self.credentials,
-            project=self.project_id,
-        )
+        # Initialize the Storage client and a local bucket handle
+        self.storage_client = _storage_client(self.project_id, self.credentials)
+        self.bucket = self.storage_client.bucket(bucket_name)
+        self._bucket_lock = threading.Lock()
+        self._uri_prefix = f"gs://{bucket_name}/"
+
+    def ensure_bucket(self) -> None:
+        """Create the bucket if it does not exist yet."""
+        with self._bucket_lock:
+            try:
+                self.storage_client.get_bucket(self.bucket_name)
+            except NotFound:
+                self.storage_client.create_bucket(self.bucket_name)
+                logger.info("Created new bucket: %s", self.bucket_name)
+
+    def _upload_creating_bucket(self, upload: Callable[[], None]) -> None:
+        """
+        Run an upload, creating the bucket and retrying once if it is missing.
 
-        # Get or create the bucket
+        Args:
+            upload: Function performing the upload, safe to call twice
+
+        """
         try:
-            self.bucket = self.storage_client.get_bucket(bucket_name)
+            upload()
         except NotFound:
-            self.bucket = self.storage_client.create_bucket(bucket_name)
-            self.logger.info(f"Created new bucket: {bucket_name}")
+            self.ensure_bucket()
+            upload()
 
     def upload_to_gcs(
-        self, data: dict | list[dict] | pd.DataFrame, prefix: str = "data"
+        self,
+        data: dict | list[dict] | pd.DataFrame | str | bytes | bytearray | memoryview,
+        prefix: str = "data",
+        file_format: Literal["ndjson", "parquet", "feather"] = "ndjson",
+        parallel_composite: bool = True,
+        compress: bool = False,
     ) -> str:
         """
         Upload data to Google Cloud Storage.
 
+        Parquet and Feather files are columnar and zstd-compressed, so they are
+        usually much smaller and faster to write than NDJSON for large DataFrames.
+        BigQuery loads Parquet files natively.
+
+        DataFrames of at least ``PARALLEL_UPLOAD_THRESHOLD`` bytes in memory are
+        written to a temporary file and uploaded in ``chunk_size`` parts by
+        ``max_workers`` threads, unless parallel_composite is False. Smaller data
+        is streamed to GCS in a single upload.
+
+        Strings and bytes are taken as already serialized in file_format and are
+        uploaded as they are, in a single request.
+
+        With compress, NDJSON is gzipped at the fastest level and stored as a
+        ``.json.gz`` file with ``Content-Encoding: gzip``, which GCS decompresses
+        transparently on download and BigQuery loads as is.
+
         Args:
-            data (Union[dict, list[dict], pd.DataFrame]): Data to upload (dict, list of dicts, or pandas DataFrame).
+            data (Union[dict, list[dict], pd.DataFrame, str, bytes]): Data to upload (dict, list of dicts, pandas DataFrame, or serialized data).
             prefix (str): Prefix for the filename in GCS. Defaults to "data".
+            file_format (str): File format, one of "ndjson", "parquet" or "feather". Defaults to "ndjson".
+            parallel_composite (bool): Whether large DataFrames are uploaded in parallel parts. Defaults to True.
+            compress (bool): Whether to gzip NDJSON before uploading. Defaults to False.
 
         Returns:
             str: URI of the uploaded file in GCS.
 
         Raises:
+            ValueError: If the file format is not supported, or compress is used
+                with Parquet or Feather.
             Exception: If an error occurs during the upload process.
 
         """
-        self.logger.debug(f"{'=' * 10} Exporting data to GCS {'=' * 10}")
-        temp_file_path: Path | None = None
+        logger.debug("%s Exporting data to GCS %s", _SEP, _SEP)
+        if file_format not in FILE_FORMATS:
+            error_message = (
+                f"Invalid file_format. Must be one of {', '.join(FILE_FORMATS)}"
+            )
+            raise ValueError(error_message)
+        if compress and file_format != "ndjson":
+            error_message = (
+                "Only NDJSON can be compressed, Parquet and Feather already are"
+            )
+            raise ValueError(error_message)
+        extension, content_type = FILE_FORMATS[file_format]
+        if compress:
+            extension += ".gz"
+
         # Generate a unique filename
-        filename = f"{prefix}_{uuid.uuid4().hex}.json"
+        filename = _unique_blob_name(prefix, extension)
 
-        # Convert data to a pandas DataFrame if it's not already
-        if isinstance(data, (dict, list)):
-            dataframe_data = (
-                pd.DataFrame(data) if isinstance(data, list) else pd.DataFrame([data])
+        def upload() -> None:
+            blob = self.bucket.blob(filename)
+            if compress:
+                blob.content_encoding = "gzip"
+            if isinstance(data, (str, bytes, bytearray, memoryview)):
+                payload = data.encode() if isinstance(data, str) else bytes(data)
+                if compress:
+                    payload = gzip.compress(payload, compresslevel=1)
+                blob.upload_from_string(
+                    payload,
+                    content_type=content_type,
+                    if_generation_match=0,
+                    checksum=UPLOAD_CHECKSUM,
+                )
+                return
+            data_size = (
+                int(data.memory_usage(deep=True).sum())
+                if parallel_composite and isinstance(data, pd.DataFrame)
+                else 0
             )
-        else:
-            dataframe_data = data
+            if data_size >= PARALLEL_UPLOAD_THRESHOLD:
+                self._upload_in_parallel(blob, data, file_format, compress, data_size)
+            else:
+                # Small data is sent in one request, larger data is streamed. The
+                # object must not exist yet, which makes retrying requests safe.
+                with _BlobSink(
+                    blob,
+                    content_type=content_type,
+                    if_generation_match=0,
+                    checksum=UPLOAD_CHECKSUM,
+                ) as blob_file:
+                    self._write_data(blob_file, data, file_format, compress)
 
         try:
-            with tempfile.NamedTemporaryFile(
-                mode="w",
-                delete=False,
-                suffix=".json",
-                encoding="utf-8",  # Added encoding
-            ) as temp_file:
-                dataframe_data.to_json(temp_file.name, orient="records", lines=True)
-                temp_file_path = Path(temp_file.name)  # Changed to Path object
-
-            # Upload the file to GCS
-            blob = self.bucket.blob(filename)
-            blob.upload_from_filename(temp_file_path)
+            self._upload_creating_bucket(upload)
 
             # Log success
-            self.logger.info(
-                f"Successfully uploaded data to gs://{self.bucket_name}/{filename}"
+            logger.info(
+                "Successfully uploaded data to %s%s", self._uri_prefix, filename
             )
 
         except Exception:
-            self.logger.exception("Error uploading to GCS.")
+            logger.exception("Error uploading to GCS.")
             raise
 
         else:
-            return f"gs://{self.bucket_name}/{filename}"
+            return f"{self._uri_prefix}{filename}"
+
+    async def upload_to_gcs_async(
+        self,
+        data: dict | list[dict] | pd.DataFrame | str | bytes | bytearray | memoryview,
+        prefix: str = "data",
+        file_format: Literal["ndjson", "parquet", "feather"] = "ndjson",
+        parallel_composite: bool = True,
+        compress: bool = False,
+    ) -> str:
+        """
+        Upload data to Google Cloud Storage without blocking the running event loop.
+
+        The upload runs ``upload_to_gcs`` in a worker thread, so many uploads can
+        be awaited concurrently, e.g. with ``asyncio.gather``.
+
+        Args:
+            data: Data to upload, see ``upload_to_gcs``
+            prefix: Prefix for the filename in GCS. Defaults to "data".
+            file_format: File format, one of "ndjson", "parquet" or "feather". Defaults to "ndjson".
+            parallel_composite: Whether large DataFrames are uploaded in parallel parts. Defaults to True.
+            compress: Whether to gzip NDJSON before uploading. Defaults to False.
+
+        Returns:
+            str: URI of the uploaded file in GCS.
+
+        """
+        return await asyncio.to_thread(
+            self.upload_to_gcs, data, prefix, file_format, parallel_composite, compress
+        )
+
+    def _upload_in_parallel(
+        self,
+        blob: storage.Blob,
+        data: pd.DataFrame,
+        file_format: str,
+        compress: bool,
+        data_size: int,
+    ) -> None:
+        """
+        Upload data through a temporary file sent in concurrent parts.
+
+        The temporary file is kept in memory-backed storage when possible, see
+        ``_temp_dir``.
+
+        Args:
+            blob: Blob to upload to
+            data: Data to upload
+            file_format: File format, a key of FILE_FORMATS
+            compress: Whether to gzip the data
+            data_size: Memory usage of the data in bytes
+
+        """
+        _, content_type = FILE_FORMATS[file_format]
+        temp_file_path: Path | None = None
+        try:
+            temp_file_path = self._write_temp_file(
+                data, file_format, compress, data_size
+            )
+
+            transfer_manager.upload_chunks_concurrently(
+                str(temp_file_path),
+                blob,
+                content_type=content_type,
+                checksum=UPLOAD_CHECKSUM,
+                chunk_size=self.chunk_size,
+                worker_type=transfer_manager.THREAD,
+                max_workers=self.max_workers,
+            )
 
         finally:
             # Clean up the temporary file
             if temp_file_path and temp_file_path.exists():
                 temp_file_path.unlink()
 
+    @classmethod
+    def _write_temp_file(
+        cls, data: pd.DataFrame, file_format: str, compress: bool, data_size: int
+    ) -> Path:
+        """
+        Write data to a temporary file, in memory-backed storage when possible.
+
+        If /dev/shm runs out of space while writing, the file is written again in
+        the default temporary directory.
+
+        Args:
+            data: Data to write
+            file_format: File format, a key of FILE_FORMATS
+            compress: Whether to gzip the data
+            data_size: Memory usage of the data in bytes
+
+        Returns:
+            Path: Path of the temporary file
+
+        """
+        temp_dir = _temp_dir(data_size)
+        try:
+            return cls._write_temp_file_in(temp_dir, data, file_format, compress)
+        except OSError as e:
+            if temp_dir is None or e.errno != errno.ENOSPC:
+                raise
+            logger.warning(
+                "%s is full, writing the temporary file to the default directory",
+                temp_dir,
+            )
+            return cls._write_temp_file_in(None, data, file_format, compress)
+
+    @classmethod
+    def _write_temp_file_in(
+        cls,
+        directory: str | None,
+        data: pd.DataFrame,
+        file_format: str,
+        compress: bool,
+    ) -> Path:
+        """
+        Write data to a new temporary file, removing it again if writing fails.
+
+        Args:
+            directory: Directory of the file, None for the default temporary directory
+            data: Data to write
+            file_format: File format, a key of FILE_FORMATS
+            compress: Whether to gzip the data
+
+        Returns:
+            Path: Path of the temporary file
+
+        """
+        extension, _ = FILE_FORMATS[file_format]
+        temp_file_path: Path | None = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                mode="wb", delete=False, suffix=extension, dir=directory
+            ) as temp_file:
+                temp_file_path = Path(temp_file.name)
+                cls._write_data(temp_file, data, file_format, compress)
+        except BaseException:
+            if temp_file_path is not None:
+                temp_file_path.unlink(missing_ok=True)
+            raise
+        return temp_file_path
+
+    @classmethod
+    def _write_data(
+        cls,
+        file: BinaryIO,
+        data: dict | list[dict] | pd.DataFrame,
+        file_format: str,
+        compress: bool = False,
+    ) -> None:
+        """
+        Write data to a binary file in the given format.
+
+        Args:
+            file: Binary file to write to
+            data: Data to write
+            file_format: File format, a key of FILE_FORMATS
+            compress: Whether to gzip the data at the fastest level
+
+        """
+        if compress:
+            with gzip.GzipFile(fileobj=file, mode="wb", compresslevel=1) as gzip_file:
+                cls._write_data(gzip_file, data, file_format)
+        elif file_format == "ndjson":
+            cls._write_ndjson(file, data)
+        else:
+            cls._write_arrow(file, data, file_format)
+
+    @staticmethod
+    def _write_ndjson(file: BinaryIO, data: dict | list[dict] | pd.DataFrame) -> None:
+        """
+        Write data to a binary file as newline-delimited JSON.
+
+        Args:
+            file: Binary file to write to
+            data: Data to write
+
+        """
+        # Dicts are already JSON-shaped, only DataFrames need converting to records
+        if isinstance(data, dict):
+            records: Iterable[dict] = [data]
+        elif isinstance(data, list):
+            records = data
+        elif _encodes_as_flat_records(data):
+            # Let pandas' C encoder write blocks of records at once, then turn
+            # each JSON array into one record per line. Blocks are sized to about
+            # UPLOAD_CHUNK_SIZE of output so memory stays bounded.
+            rows_per_block = max(
+                1, UPLOAD_CHUNK_SIZE // (JSON_BYTES_PER_CELL * max(1, data.shape[1]))
+            )
+            for start in range(0, len(data), rows_per_block):
+                json_records = data.iloc[start : start + rows_per_block].to_json(
+                    orient="records", date_format="iso", date_unit="us"
+                )
+                file.write(json_records[1:-1].replace("},{", "}\n{").encode())
+                file.write(b"\n")
+            return
+        else:
+            # Convert each column to Python objects in one pass and build the
+            # records lazily, instead of boxing the frame cell by cell
+            names = [str(name) for name in data.columns]
+            columns = [column.tolist() for _, column in data.items()]
+            records = (dict(zip(names, row, strict=True)) for row in zip(*columns))
+
+        file.writelines(_ndjson_line(record) for record in records)
+
+    @staticmethod
+    def _write_arrow(
+        file: BinaryIO, data: dict | list[dict] | pd.DataFrame, file_format: str
+    ) -> None:
+        """
+        Write data to a binary file as zstd-compressed Parquet or Feather.
+
+        Args:
+            file: Binary file to write to
+            data: Data to write
+            file_format: "parquet" or "feather"
+
+        """
+        if isinstance(data, dict):
+            data = pd.DataFrame([data])
+        elif isinstance(data, list):
+            data = pd.DataFrame(data)
+        table = pa.Table.from_pandas(data, preserve_index=False)
+
+        if file_format == "parquet":
+            pa_parquet.write_table(table, file, compression="zstd")
+        else:
+            pa_feather.write_feather(table, file, compression="zstd")
+
+    def upload_ndjson(self, rows: Iterable[dict], blob_name: str) -> str:
+        """
+        Stream records to Google Cloud Storage as newline-delimited JSON.
+
+        Each record is serialized to bytes with orjson as it is consumed. Files up
+        to ``UPLOAD_CHUNK_SIZE`` bytes are sent in a single request, larger ones
+        are streamed through a resumable upload, so at most one upload chunk is
+        held in memory. Values are encoded as in ``upload_to_gcs``, e.g. datetime
+        values in ISO format and missing values as null.
+
+        Args:
+            rows: Records to upload
+            blob_name: Name of the file in GCS
+
+        Returns:
+            str: URI of the uploaded file in GCS.
+
+        Raises:
+            Exception: If an error occurs during the upload process.
+
+        """
+        logger.debug("%s Streaming data to GCS %s", _SEP, _SEP)
+
+        def upload() -> None:
+            blob = self.bucket.blob(blob_name)
+            # The object must not exist yet, so files of other writers are never
+            # overwritten and retrying the upload requests is safe
+            with _BlobSink(
+                blob,
+                content_type="application/json",
+                if_generation_match=0,
+                checksum=UPLOAD_CHECKSUM,
+            ) as blob_file:
+                for row in rows:
+                    blob_file.write(_ndjson_line(row))
+
+        try:
+            # Only a list can be written again after a missing bucket is created
+            if isinstance(rows, list):
+                self._upload_creating_bucket(upload)
+            else:
+                upload()
+
+            logger.info(
+                "Successfully uploaded data to %s%s", self._uri_prefix, blob_name
+            )
+
+        except Exception:
+            logger.exception("Error uploading to GCS.")
+            raise
+
+        else:
+            return f"{self._uri_prefix}{blob_name}"
+
+    def _blob_name(self, gcs_uri: str) -> str:
+        """
+        Extract the blob name from a URI in the bucket.
+
+        Args:
+            gcs_uri: URI of the file in GCS
+
+        Returns:
+            str: Name of the blob
+
+        Raises:
+            ValueError: If the URI does not point into the bucket
+
+        """
+        if not gcs_uri.startswith(self._uri_prefix):
+            error_message = f"{gcs_uri} is not in bucket {self.bucket_name}"
+            raise ValueError(error_message)
+        return gcs_uri.removeprefix(self._uri_prefix)
+
     def delete_file(self, gcs_uri: str) -> None:
         """
         Delete a file from Google Cloud Storage.
@@ -132,25 +892,206 @@ class StorageController:
             gcs_uri: URI of the file in GCS to delete
 
         """
-        self.logger.debug(f"{'=' * 10} Deleting data from GCS {'=' * 10}")
+        logger.debug("%s Deleting data from GCS %s", _SEP, _SEP)
         try:
-            # Extract blob name from URI
-            blob_name = gcs_uri.replace(f"gs://{self.bucket_name}/", "")
+            blob_name = self._blob_name(gcs_uri)
 
             # Delete the blob
             self.bucket.blob(blob_name).delete()
-            self.logger.info(f"Deleted file: {gcs_uri}")
+            logger.info("Deleted file: %s", gcs_uri)
 
         except NotFound:
             # File not found is often acceptable for cleanup operations
-            self.logger.warning(
-                f"File not found during deletion: {gcs_uri}. It may have already been deleted."
+            logger.warning(
+                "File not found during deletion: %s. It may have already been deleted.",
+                gcs_uri,
             )
         except GoogleCloudError:
             # Catch other Google Cloud related errors
-            self.logger.exception(f"Google Cloud error deleting file {gcs_uri}.")
+            logger.exception("Google Cloud error deleting file %s.", gcs_uri)
         except Exception:
             # Catch any other unexpected exceptions.
-            self.logger.exception(
-                f"An unexpected error occurred while deleting file {gcs_uri}."
+            logger.exception(
+                "An unexpected error occurred while deleting file %s.", gcs_uri
             )
+
+    def delete_files(self, gcs_uris: Iterable[str]) -> None:
+        """
+        Delete several files from Google Cloud Storage using batch requests.
+
+        Deletions are grouped into batches of ``DELETE_BATCH_SIZE`` calls, so each
+        group costs a single HTTP round trip, and up to ``max_workers`` batches
+        are sent concurrently. Files that are already gone are ignored, as in
+        ``delete_file``.
+
+        Args:
+            gcs_uris: URIs of the files in GCS to delete
+
+        Raises:
+            ValueError: If a URI does not point into the bucket
+
+        """
+        logger.debug("%s Deleting data from GCS %s", _SEP, _SEP)
+        blob_names = [self._blob_name(gcs_uri) for gcs_uri in gcs_uris]
+        batches = [
+            blob_names[start : start + DELETE_BATCH_SIZE]
+            for start in range(0, len(blob_names), DELETE_BATCH_SIZE)
+        ]
+
+        if len(batches) <= 1:
+            for batch_names in batches:
+                self._delete_batch(batch_names)
+            return
+
+        # The client keeps the active batch per thread, so batches can be sent
+        # from several threads at once
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(batches))
+        ) as executor:
+            list(executor.map(self._delete_batch, batches))
+
+    def _delete_batch(self, blob_names: list[str]) -> None:
+        """
+        Delete up to ``DELETE_BATCH_SIZE`` blobs with a single batch request.
+
+        Args:
+            blob_names: Names of the blobs to delete
+
+        """
+        try:
+            with self.storage_client.batch():
+                for blob_name in blob_names:
+                    self.bucket.blob(blob_name).delete()
+            logger.info("Deleted %s files", len(blob_names))
+
+        except NotFound:
+            # The other deletions of the batch have still been applied
+            logger.warning(
+                "Some files were not found during deletion. They may have already been deleted."
+            )
+        except GoogleCloudError:
+            logger.exception("Google Cloud error deleting files.")
+        except Exception:
+            logger.exception("An unexpected error occurred while deleting files.")
+
+
+class BufferedUploader:
+    """
+    Accumulate records in memory and upload them as few NDJSON files.
+
+    Each appended record is encoded immediately. The buffer is uploaded as one
+    file once it holds ``max_records`` records or ``max_bytes`` bytes, or when
+    a record is appended more than ``max_interval`` seconds after the previous
+    upload. A record that would take the buffer past ``max_bytes`` is put in
+    the next file, so files only exceed it if a single record does. Remaining
+    records are uploaded by ``flush`` or when leaving the ``with`` block.
+
+    Attributes:
+        storage_controller (StorageController): Controller of the target bucket
+        prefix (str): Prefix of the uploaded file names
+        max_records (int): Records per file
+        max_bytes (int): Maximum encoded size of a file in bytes
+        max_interval (float): Maximum seconds between uploads
+        uploaded_uris (list[str]): URIs of the files uploaded so far
+
+    """
+
+    def __init__(
+        self,
+        storage_controller: StorageController,
+        prefix: str = "data",
+        max_records: int = 10000,
+        max_bytes: int = 16 * 1024 * 1024,
+        max_interval: float = 60,
+    ) -> None:
+        """
+        Initialize an empty buffer.
+
+        Args:
+            storage_controller: Controller of the target bucket
+            prefix: Prefix of the uploaded file names
+            max_records: Records per file
+            max_bytes: Maximum encoded size of a file in bytes
+            max_interval: Maximum seconds between uploads
+
+        """
+        self.storage_controller = storage_controller
+        self.prefix = prefix
+        self.max_records = max_records
+        self.max_bytes = max_bytes
+        self.max_interval = max_interval
+        self.uploaded_uris: list[str] = []
+
+        self._buffer = bytearray()
+        self._record_count = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> Self:
+        """Return the uploader itself."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Upload the records still in the buffer."""
+        self.flush()
+
+    def append(self, record: dict) -> str | None:
+        """
+        Add a record to the buffer, uploading the buffer if it is full.
+
+        Args:
+            record: Record to add
+
+        Returns:
+            str | None: URI of the last file uploaded, None if nothing was uploaded
+
+        """
+        line = _ndjson_line(record)
+        with self._lock:
+            gcs_uri = None
+            # Upload the buffer first if the record does not fit in it anymore
+            if self._buffer and len(self._buffer) + len(line) > self.max_bytes:
+                gcs_uri = self._flush()
+
+            self._buffer += line
+            self._record_count += 1
+            if (
+                self._record_count >= self.max_records
+                or len(self._buffer) >= self.max_bytes
+                or time.monotonic() - self._last_flush >= self.max_interval
+            ):
+                gcs_uri = self._flush()
+        return gcs_uri
+
+    def flush(self) -> str | None:
+        """
+        Upload the buffered records as one NDJSON file.
+
+        Returns:
+            str | None: URI of the uploaded file, None if the buffer was empty
+
+        """
+        with self._lock:
+            return self._flush()
+
+    def _flush(self) -> str | None:
+        """
+        Upload the buffer, the caller must hold the lock.
+
+        Returns:
+            str | None: URI of the uploaded file, None if the buffer was empty
+
+        """
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return None
+
+        # The encoded records are uploaded as they are, as NDJSON
+        gcs_uri = self.storage_controller.upload_to_gcs(
+            bytes(self._buffer), prefix=self.prefix
+        )
+        logger.info("Uploaded %s buffered records to %s", self._record_count, gcs_uri)
+        self.uploaded_uris.append(gcs_uri)
+        self._buffer.clear()
+        self._record_count = 0
+        return gcs_uri
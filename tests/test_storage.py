@@ -0,0 +1,88 @@
+"""Tests of the blob sink state machine in vnp.storage."""
+
+from __future__ import annotations
+
+import gc
+from unittest import mock
+
+import pytest
+from google.cloud.storage.fileio import BlobWriter
+
+from vnp.storage import UPLOAD_CHUNK_SIZE, _BlobSink
+
+UPLOAD_KWARGS = {"content_type": "application/json", "if_generation_match": 0}
+
+
+class _WriteError(Exception):
+    """Error raised inside the ``with`` block of a sink."""
+
+
+@pytest.fixture
+def blob() -> mock.Mock:
+    """Blob whose resumable uploads go through a real BlobWriter."""
+    blob = mock.Mock()
+    blob.name = "test.json"
+    blob.chunk_size = None
+    blob._initiate_resumable_upload.return_value = (mock.Mock(), mock.Mock())
+    blob.open.side_effect = lambda mode, **kwargs: BlobWriter(blob, **kwargs)
+    return blob
+
+
+def _transmitted_chunks(blob: mock.Mock) -> int:
+    """Return the number of resumable chunks sent for a blob."""
+    if not blob._initiate_resumable_upload.called:
+        return 0
+    upload, _ = blob._initiate_resumable_upload.return_value
+    return upload.transmit_next_chunk.call_count
+
+
+def test_small_upload_is_sent_in_one_request(blob: mock.Mock) -> None:
+    with _BlobSink(blob, **UPLOAD_KWARGS) as sink:
+        sink.write(b"{}\n")
+
+    blob.upload_from_file.assert_called_once()
+    assert blob.upload_from_file.call_args.kwargs["size"] == 3
+    blob.open.assert_not_called()
+
+
+def test_small_upload_is_abandoned_on_error(blob: mock.Mock) -> None:
+    with pytest.raises(_WriteError), _BlobSink(blob, **UPLOAD_KWARGS) as sink:
+        sink.write(b"{}\n")
+        raise _WriteError
+
+    gc.collect()
+    blob.upload_from_file.assert_not_called()
+    blob.open.assert_not_called()
+
+
+def test_large_upload_is_streamed(blob: mock.Mock) -> None:
+    with _BlobSink(blob, **UPLOAD_KWARGS) as sink:
+        sink.write(b"x" * (UPLOAD_CHUNK_SIZE + 1))
+
+    # One full chunk while writing, the remainder when closing
+    assert _transmitted_chunks(blob) == 2
+    blob.upload_from_file.assert_not_called()
+
+
+def test_large_upload_is_terminated_on_error(blob: mock.Mock) -> None:
+    with pytest.raises(_WriteError), _BlobSink(blob, **UPLOAD_KWARGS) as sink:
+        sink.write(b"x" * (UPLOAD_CHUNK_SIZE + 1))
+        raise _WriteError
+
+    # Collecting the writer must not send the remainder and commit the object
+    gc.collect()
+    assert _transmitted_chunks(blob) == 1
+    upload, transport = blob._initiate_resumable_upload.return_value
+    transport.delete.assert_called_once_with(upload.upload_url)
+
+
+def test_large_upload_is_not_committed_if_cancelling_fails(blob: mock.Mock) -> None:
+    _, transport = blob._initiate_resumable_upload.return_value
+    transport.delete.side_effect = ConnectionError
+
+    with pytest.raises(_WriteError), _BlobSink(blob, **UPLOAD_KWARGS) as sink:
+        sink.write(b"x" * (UPLOAD_CHUNK_SIZE + 1))
+        raise _WriteError
+
+    gc.collect()
+    assert _transmitted_chunks(blob) == 1